@@ -1,30 +1,157 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+import importlib.util
+from itertools import groupby
 import mimetypes
 import os
+import time
 from pathlib import Path, PurePosixPath
-from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    IO,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 
 from ..client import Client, register_client_class
 from ..cloudpath import implementation_registry
 from ..enums import FileCacheMode
-from ..exceptions import MissingCredentialsError
+from ..exceptions import (
+    CloudPathException,
+    CloudPathIsADirectoryError,
+    MissingCredentialsError,
+)
 from .azblobpath import AzureBlobPath
 
 
-try:
+# importing the Azure SDK takes a noticeable fraction of a second, so its names are imported
+# where they are used rather than when this module is imported
+if TYPE_CHECKING:
     from azure.core.exceptions import ResourceNotFoundError
-    from azure.storage.blob import (
-        BlobSasPermissions,
-        BlobServiceClient,
-        BlobProperties,
-        ContentSettings,
-        generate_blob_sas,
-    )
+    from azure.storage.blob import BlobClient, BlobServiceClient, BlobProperties, ContainerClient
+    import requests
+
+
+try:
+    _sdk_found = importlib.util.find_spec("azure.storage.blob") is not None
 except ModuleNotFoundError:
+    _sdk_found = False
+
+if not _sdk_found:
     implementation_registry["azure"].dependencies_loaded = False
 
 
+# the blob batch API accepts at most 256 subrequests per call
+MAX_BATCH_SIZE = 256
+
+# number of batch requests to have in flight at once; each one already carries many deletes
+MAX_BATCH_CONCURRENCY = 8
+
+# seconds to wait between checks on a copy the service is still running; the wait doubles after
+# each check, up to the maximum
+COPY_POLL_INTERVAL = 0.5
+MAX_COPY_POLL_INTERVAL = 30
+
+# transport settings for service clients created by AzureBlobClient; the pool is sized for the
+# parallel transfers and delete batches above, the read timeout gives large ranges and batches
+# time to finish, and request bodies are written to the socket in 32 KiB blocks as azure-core does
+CONNECTION_POOL_MAXSIZE = 128
+CONNECTION_TIMEOUT = 20
+READ_TIMEOUT = 300
+SOCKET_BLOCKSIZE = 32 * 1024
+
+# number of blob clients to keep around for reuse
+MAX_CACHED_BLOB_CLIENTS = 1024
+
+# number of metadata lookups to remember for metadata_cache_ttl seconds
+MAX_CACHED_METADATA = 4096
+
+# downloads at least this large have their full size reserved on disk before writing
+MIN_PREALLOCATE_SIZE = 64 * 1024 * 1024
+
+
+def _is_folder_placeholder(properties: "BlobProperties") -> bool:
+    # hierarchical namespace directories are stored as blobs without content settings
+    content_settings = properties.content_settings
+    return content_settings.content_type is None and content_settings.content_md5 is None
+
+
+def _pooled_session() -> "requests.Session":
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    class _BlockSizeHTTPAdapter(HTTPAdapter):
+        # like the adapter azure-core mounts by default, write request bodies to the socket in
+        # larger blocks than the 8 KiB http.client uses; requests before 2.32 look connections
+        # up with get_connection, later versions with get_connection_with_tls_context
+        def get_connection(self, *args: Any, **kwargs: Any) -> Any:
+            conn: Any = super().get_connection(*args, **kwargs)
+            conn.conn_kw["blocksize"] = SOCKET_BLOCKSIZE
+            return conn
+
+        def get_connection_with_tls_context(self, *args: Any, **kwargs: Any) -> Any:
+            conn: Any = super().get_connection_with_tls_context(*args, **kwargs)
+            conn.conn_kw["blocksize"] = SOCKET_BLOCKSIZE
+            return conn
+
+    session = requests.Session()
+
+    # azure-core retries failed requests itself, so requests should not retry them as well
+    adapter = _BlockSizeHTTPAdapter(
+        pool_maxsize=CONNECTION_POOL_MAXSIZE,
+        max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+
+def _preallocate(f: IO[bytes], size: int) -> None:
+    # reserve the full extent up front so ranges written out of order by parallel downloads
+    # do not fragment large files. On filesystems without native fallocate support (e.g. NFS,
+    # some FUSE and ZFS setups) glibc emulates it by writing to every block, which costs a full
+    # extra pass of writes before the download starts, so small files are left alone
+    if size >= MIN_PREALLOCATE_SIZE and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+        except OSError:
+            pass
+
+
+def _default_max_concurrency() -> int:
+    # parallel range requests are network-bound, so use several per core
+    return min(64, (os.cpu_count() or 4) * 4)
+
+
+@dataclass
+class AzureBlobInfo:
+    """Summary of a single metadata lookup for an Azure path, so that callers can answer
+    existence, type, and staleness questions without making another request."""
+
+    exists: bool
+    is_dir: bool
+    size: Optional[int] = None
+    mtime: Optional[datetime] = None
+    etag: Optional[str] = None
+    content_type: Optional[str] = None
+
+
 @register_client_class("azure")
 class AzureBlobClient(Client):
     """Client class for Azure Blob Storage which handles authentication with Azure for
@@ -42,6 +169,12 @@ class AzureBlobClient(Client):
         file_cache_mode: Optional[Union[str, FileCacheMode]] = None,
         local_cache_dir: Optional[Union[str, os.PathLike]] = None,
         content_type_method: Optional[Callable] = mimetypes.guess_type,
+        max_download_concurrency: Optional[int] = None,
+        max_chunk_get_size: int = 4 * 1024 * 1024,
+        max_upload_concurrency: Optional[int] = None,
+        max_block_size: int = 8 * 1024 * 1024,
+        metadata_cache_ttl: float = 5.0,
+        copy_timeout: Optional[float] = 60 * 60,
     ):
         """Class constructor. Sets up a [`BlobServiceClient`](
         https://docs.microsoft.com/en-us/python/api/azure-storage-blob/azure.storage.blob.blobserviceclient?view=azure-python).
@@ -76,6 +209,8 @@ class AzureBlobClient(Client):
                 https://docs.microsoft.com/en-us/azure/storage/blobs/storage-quickstart-blobs-python#copy-your-credentials-from-the-azure-portal).
             blob_service_client (Optional[BlobServiceClient]): Instantiated [`BlobServiceClient`](
                 https://docs.microsoft.com/en-us/python/api/azure-storage-blob/azure.storage.blob.blobserviceclient?view=azure-python).
+                Otherwise, the `BlobServiceClient` is created with a connection pool of 128
+                connections and a 300 second read timeout to suit parallel transfers.
             file_cache_mode (Optional[Union[str, FileCacheMode]]): How often to clear the file cache; see
                 [the caching docs](https://cloudpathlib.drivendata.org/stable/caching/) for more information
                 about the options in cloudpathlib.eums.FileCacheMode.
@@ -84,6 +219,27 @@ class AzureBlobClient(Client):
                 the `CLOUDPATHLIB_LOCAL_CACHE_DIR` environment variable.
             content_type_method (Optional[Callable]): Function to call to guess media type (mimetype) when
                 writing a file to the cloud. Defaults to `mimetypes.guess_type`. Must return a tuple (content type, content encoding).
+            max_download_concurrency (Optional[int]): Maximum number of parallel connections used to
+                download a single blob. Defaults to four per CPU, capped at 64.
+            max_chunk_get_size (int): Size in bytes of each ranged request made when downloading a
+                blob in parallel. Only applies to a `BlobServiceClient` created by this client, not
+                to one passed in with `blob_service_client`. Defaults to 4 MiB.
+            max_upload_concurrency (Optional[int]): Maximum number of parallel connections used to
+                upload a single blob. Defaults to four per CPU, capped at 64.
+            max_block_size (int): Size in bytes of each block staged when uploading a blob in
+                parallel. Files up to this size are uploaded in a single request. Only applies to a
+                `BlobServiceClient` created by this client, not to one passed in with
+                `blob_service_client`. Defaults to 8 MiB.
+            metadata_cache_ttl (float): Number of seconds to reuse the result of looking up whether
+                a path exists and what it is, so that repeated checks on the same path do not each
+                make a request. Writes made through this client update the cache immediately, but
+                changes made elsewhere may take this long to be seen. While this is positive,
+                containers that have been seen to exist are also remembered until a request finds
+                them missing. Set to 0 to always make a request. Defaults to 5 seconds.
+            copy_timeout (Optional[float]): Maximum number of seconds that moving or renaming a
+                blob waits for a server-side copy the service is still running. If the copy has not
+                finished by then, a `CloudPathException` is raised and the source is left in place.
+                If None, waits until the copy finishes. Defaults to one hour.
         """
         super().__init__(
             local_cache_dir=local_cache_dir,
@@ -91,6 +247,19 @@ class AzureBlobClient(Client):
             file_cache_mode=file_cache_mode,
         )
 
+        from azure.storage.blob import BlobServiceClient
+
+        if max_download_concurrency is None:
+            max_download_concurrency = _default_max_concurrency()
+        self.max_download_concurrency = max_download_concurrency
+
+        if max_upload_concurrency is None:
+            max_upload_concurrency = _default_max_concurrency()
+        self.max_upload_concurrency = max_upload_concurrency
+        self.max_block_size = max_block_size
+        self.metadata_cache_ttl = metadata_cache_ttl
+        self.copy_timeout = copy_timeout
+
         if connection_string is None:
             connection_string = os.getenv("AZURE_STORAGE_CONNECTION_STRING", None)
 
@@ -98,38 +267,244 @@ class AzureBlobClient(Client):
             self.service_client = blob_service_client
         elif connection_string is not None:
             self.service_client = BlobServiceClient.from_connection_string(
-                conn_str=connection_string, credential=credential
+                conn_str=connection_string,
+                credential=credential,
+                **self._service_client_kwargs(max_chunk_get_size, max_block_size),
             )
         elif account_url is not None:
-            self.service_client = BlobServiceClient(account_url=account_url, credential=credential)
+            self.service_client = BlobServiceClient(
+                account_url=account_url,
+                credential=credential,
+                **self._service_client_kwargs(max_chunk_get_size, max_block_size),
+            )
         else:
             raise MissingCredentialsError(
                 "AzureBlobClient does not support anonymous instantiation. "
                 "Credentials are required; see docs for options."
             )
 
-    def _get_metadata(self, cloud_path: AzureBlobPath) -> Union["BlobProperties", Dict[str, Any]]:
-        blob = self.service_client.get_blob_client(
-            container=cloud_path.container, blob=cloud_path.blob
+        # constructing these sets up a request pipeline each time, so reuse them
+        self._container_clients: Dict[str, "ContainerClient"] = {}
+        self._blob_clients: Dict[Tuple[str, str], "BlobClient"] = {}
+
+        # (expiry time, lookup result) for recently looked up paths
+        self._metadata_cache: Dict[Tuple[str, str], Tuple[float, AzureBlobInfo]] = {}
+
+        # containers that have been seen to exist, so they do not need to be checked again
+        self._verified_containers: Set[str] = set()
+
+    @staticmethod
+    def _service_client_kwargs(max_chunk_get_size: int, max_block_size: int) -> Dict[str, Any]:
+        return dict(
+            max_chunk_get_size=max_chunk_get_size,
+            max_block_size=max_block_size,
+            # anything larger than one block is staged in parallel blocks rather than being sent
+            # in a single request
+            max_single_put_size=max_block_size,
+            session=_pooled_session(),
+            connection_timeout=CONNECTION_TIMEOUT,
+            read_timeout=READ_TIMEOUT,
         )
-        properties = blob.get_blob_properties()
+
+    def _container_client(self, container: str) -> "ContainerClient":
+        if container not in self._container_clients:
+            self._container_clients[container] = self.service_client.get_container_client(
+                container
+            )
+
+        return self._container_clients[container]
+
+    def _blob_client(self, container: str, blob: str) -> "BlobClient":
+        key = (container, blob)
+
+        if key not in self._blob_clients:
+            # evict the oldest entry to keep the cache bounded
+            if len(self._blob_clients) >= MAX_CACHED_BLOB_CLIENTS:
+                self._blob_clients.pop(next(iter(self._blob_clients)), None)
+
+            self._blob_clients[key] = self.service_client.get_blob_client(
+                container=container, blob=blob
+            )
+
+        return self._blob_clients[key]
+
+    def _get_metadata(
+        self, cloud_path: AzureBlobPath, etag: Optional[str] = None
+    ) -> Union["BlobProperties", Dict[str, Any]]:
+        from azure.core import MatchConditions
+
+        blob = self._blob_client(cloud_path.container, cloud_path.blob)
+
+        if etag is None:
+            properties = blob.get_blob_properties()
+        else:
+            # fails with a 304 HttpResponseError if the blob still has this etag
+            properties = blob.get_blob_properties(
+                etag=etag, match_condition=MatchConditions.IfModified
+            )
 
         properties["content_type"] = properties.content_settings.content_type
 
         return properties
 
+    def _get_blob_properties(
+        self, cloud_path: AzureBlobPath, check_dir: bool = True
+    ) -> AzureBlobInfo:
+        from azure.core.exceptions import HttpResponseError
+
+        # short-circuit the root-level container
+        if not cloud_path.blob:
+            return AzureBlobInfo(exists=True, is_dir=True)
+
+        key = (cloud_path.container, cloud_path.blob)
+        stale: Optional[AzureBlobInfo] = None
+
+        cached = self._metadata_cache.get(key)
+        if cached is not None:
+            expiry, properties = cached
+            if time.monotonic() < expiry:
+                return properties
+
+            self._metadata_cache.pop(key, None)
+            stale = properties
+
+        # an expired entry for a blob is revalidated with its etag, so that an unchanged blob
+        # gets an empty 304 response instead of its properties
+        try:
+            properties = self._fetch_blob_properties(
+                cloud_path, check_dir, etag=stale.etag if stale is not None else None
+            )
+        except HttpResponseError as e:
+            # the SDK does not map a 304 from this request to ResourceNotModifiedError
+            if e.status_code != 304:
+                raise
+
+            properties = cast(AzureBlobInfo, stale)
+
+        # without check_dir a missing blob may still be a directory, so that is not cached
+        if self.metadata_cache_ttl > 0 and (check_dir or properties.exists):
+            # evict the oldest entry to keep the cache bounded
+            if len(self._metadata_cache) >= MAX_CACHED_METADATA:
+                self._metadata_cache.pop(next(iter(self._metadata_cache)), None)
+
+            self._metadata_cache[key] = (time.monotonic() + self.metadata_cache_ttl, properties)
+
+        return properties
+
+    def _fetch_blob_properties(
+        self, cloud_path: AzureBlobPath, check_dir: bool, etag: Optional[str] = None
+    ) -> AzureBlobInfo:
+        from azure.core.exceptions import ResourceNotFoundError
+
+        try:
+            properties = cast("BlobProperties", self._get_metadata(cloud_path, etag=etag))
+        except ResourceNotFoundError as e:
+            self._forget_missing_container(cloud_path.container, e)
+
+            if not check_dir:
+                return AzureBlobInfo(exists=False, is_dir=False)
+
+            prefix = cloud_path.blob
+            if prefix and not prefix.endswith("/"):
+                prefix += "/"
+
+            # not a file, see if it is a directory
+            is_dir = self._prefix_exists(cloud_path.container, prefix)
+            return AzureBlobInfo(exists=is_dir, is_dir=is_dir)
+
+        self._remember_container(cloud_path.container)
+
+        return AzureBlobInfo(
+            exists=True,
+            is_dir=_is_folder_placeholder(properties),
+            size=properties.size,
+            mtime=properties.last_modified,
+            etag=properties.etag,
+            content_type=properties.content_settings.content_type,
+        )
+
+    def _remember_container(self, container: str) -> None:
+        if self.metadata_cache_ttl > 0:
+            self._verified_containers.add(container)
+
+    def _forget_missing_container(self, container: str, error: "ResourceNotFoundError") -> None:
+        # the container was deleted after it was seen, so check it again next time
+        if getattr(error, "error_code", None) == "ContainerNotFound":
+            self._verified_containers.discard(container)
+
+    @contextmanager
+    def _checking_container(self, container: str) -> Iterator[None]:
+        from azure.core.exceptions import ResourceNotFoundError
+
+        try:
+            yield
+        except ResourceNotFoundError as e:
+            self._forget_missing_container(container, e)
+            raise
+
+    def _invalidate_metadata(self, cloud_path: AzureBlobPath) -> None:
+        # writing or deleting a blob can create or remove the directories above it, and
+        # deleting a directory removes everything below it, which for the container root is
+        # everything in the container
+        blob = cloud_path.blob
+        prefix = blob.rstrip("/") + "/"
+
+        for container, cached_blob in list(self._metadata_cache):
+            if container == cloud_path.container and (
+                not blob
+                or cached_blob == blob
+                or prefix.startswith(cached_blob.rstrip("/") + "/")
+                or cached_blob.startswith(prefix)
+            ):
+                self._metadata_cache.pop((container, cached_blob), None)
+
+    def _prefix_exists(self, container: str, prefix: str) -> bool:
+        container_client = self._container_client(container)
+
+        # one result is enough, so ask for pages of one entry instead of the default 5000;
+        # iterate rather than only reading the first page since the service may return an
+        # empty page with a continuation token
+        with self._checking_container(container):
+            blobs = container_client.list_blobs(name_starts_with=prefix, results_per_page=1)
+
+            try:
+                next(blobs)
+                return True
+            except StopIteration:
+                return False
+
     @staticmethod
     def _partial_filename(local_path) -> Path:
         return Path(str(local_path) + ".part")
 
     def _download_file(
-        self, cloud_path: AzureBlobPath, local_path: Union[str, os.PathLike]
+        self,
+        cloud_path: AzureBlobPath,
+        local_path: Union[str, os.PathLike],
+        properties: Optional[AzureBlobInfo] = None,
     ) -> Path:
-        blob = self.service_client.get_blob_client(
-            container=cloud_path.container, blob=cloud_path.blob
-        )
+        from azure.core.exceptions import ResourceNotFoundError
 
-        download_stream = blob.download_blob()
+        if properties is not None:
+            if not properties.exists:
+                raise FileNotFoundError(f"File does not exist: {cloud_path}")
+            if properties.is_dir:
+                raise CloudPathIsADirectoryError(f"Cannot download a directory: {cloud_path}")
+
+        blob = self._blob_client(cloud_path.container, cloud_path.blob)
+
+        # the first range is requested right away, so a missing blob fails here without
+        # needing a separate existence check first
+        try:
+            download_stream = blob.download_blob(max_concurrency=self.max_download_concurrency)
+        except ResourceNotFoundError as e:
+            # the blob was removed since it was last looked up
+            self._invalidate_metadata(cloud_path)
+            self._forget_missing_container(cloud_path.container, e)
+            raise FileNotFoundError(f"File does not exist: {cloud_path}")
+
+        if _is_folder_placeholder(download_stream.properties):
+            raise CloudPathIsADirectoryError(f"Cannot download a directory: {cloud_path}")
 
         local_path = Path(local_path)
 
@@ -138,6 +513,11 @@ class AzureBlobClient(Client):
         try:
             partial_local_path = self._partial_filename(local_path)
             with partial_local_path.open("wb") as data:
+                _preallocate(data, download_stream.size)
+
+                # with parallel connections, readinto writes each range at its offset in the
+                # (seekable) file as it arrives, so memory stays bounded by the ranges in flight;
+                # chunks() would fetch the ranges one at a time
                 download_stream.readinto(data)
 
             partial_local_path.replace(local_path)
@@ -149,46 +529,39 @@ class AzureBlobClient(Client):
 
         return local_path
 
-    def _is_file_or_dir(self, cloud_path: AzureBlobPath) -> Optional[str]:
-        # short-circuit the root-level container
-        if not cloud_path.blob:
-            return "dir"
-
-        try:
-            metadata = self._get_metadata(cloud_path)
-            assert isinstance(metadata, BlobProperties)
-
-            is_folder = metadata.content_settings.content_type is None and metadata.content_settings.content_md5 is None
-
-            if is_folder:
-                return "dir"
+    def _is_file_or_dir(
+        self, cloud_path: AzureBlobPath, properties: Optional[AzureBlobInfo] = None
+    ) -> Optional[str]:
+        if properties is None:
+            properties = self._get_blob_properties(cloud_path)
 
-            return "file"
-        except ResourceNotFoundError:
-            prefix = cloud_path.blob
-            if prefix and not prefix.endswith("/"):
-                prefix += "/"
+        if not properties.exists:
+            return None
 
-            # not a file, see if it is a directory
-            container_client = self.service_client.get_container_client(cloud_path.container)
+        return "dir" if properties.is_dir else "file"
 
-            try:
-                next(container_client.list_blobs(name_starts_with=prefix))
-                return "dir"
-            except StopIteration:
-                return None
-
-    def _exists(self, cloud_path: AzureBlobPath) -> bool:
+    def _exists(
+        self, cloud_path: AzureBlobPath, properties: Optional[AzureBlobInfo] = None
+    ) -> bool:
         # short circuit when only the container
         if not cloud_path.blob:
-            return self.service_client.get_container_client(cloud_path.container).exists()
+            if self.metadata_cache_ttl > 0 and cloud_path.container in self._verified_containers:
+                return True
+
+            exists = self._container_client(cloud_path.container).exists()
+            if exists:
+                self._remember_container(cloud_path.container)
+
+            return exists
 
-        return self._is_file_or_dir(cloud_path) in ["file", "dir"]
+        return self._is_file_or_dir(cloud_path, properties) in ["file", "dir"]
 
     def _list_dir(
         self, cloud_path: AzureBlobPath, recursive: bool = False
     ) -> Iterable[Tuple[AzureBlobPath, bool]]:
-        container_client = self.service_client.get_container_client(cloud_path.container)
+        from azure.storage.blob import BlobPrefix
+
+        container_client = self._container_client(cloud_path.container)
 
         prefix = cloud_path.blob
         if prefix and not prefix.endswith("/"):
@@ -199,40 +572,108 @@ class AzureBlobClient(Client):
         else:
             blobs = container_client.list_blobs(name_starts_with=prefix)
 
-        for blob in blobs:
-            # walk_blobs returns folders with a trailing slash
-            blob_path = blob.name.rstrip("/")
-            blob_cloud_path = self.CloudPath(f"az://{cloud_path.container}/{blob_path}")
-            yield blob_cloud_path, blob_cloud_path.is_dir()
+        with self._checking_container(cloud_path.container):
+            for blob in blobs:
+                # walk_blobs returns folders with a trailing slash
+                blob_path = blob.name.rstrip("/")
+                blob_cloud_path = self.CloudPath(f"az://{cloud_path.container}/{blob_path}")
+
+                # the listing already says what each entry is, so there is no need to look it up
+                is_dir = isinstance(blob, BlobPrefix) or _is_folder_placeholder(blob)
+                yield blob_cloud_path, is_dir
 
     def _move_file(
         self, src: AzureBlobPath, dst: AzureBlobPath, remove_src: bool = True
     ) -> AzureBlobPath:
         # just a touch, so "REPLACE" metadata
         if src == dst:
-            blob_client = self.service_client.get_blob_client(
-                container=src.container, blob=src.blob
-            )
+            blob_client = self._blob_client(src.container, src.blob)
 
-            blob_client.set_blob_metadata(
-                metadata=dict(last_modified=str(datetime.utcnow().timestamp()))
-            )
+            blob_client.set_blob_metadata(metadata=dict(last_modified=str(time.time())))
+            self._invalidate_metadata(src)
 
         else:
-            target = self.service_client.get_blob_client(container=dst.container, blob=dst.blob)
+            target = self._blob_client(dst.container, dst.blob)
 
-            source = self.service_client.get_blob_client(container=src.container, blob=src.blob)
+            source = self._blob_client(src.container, src.blob)
 
-            target.start_copy_from_url(source.url)
+            with self._checking_container(dst.container):
+                copy = target.start_copy_from_url(source.url)
+            self._invalidate_metadata(dst)
+
+            # copies within an account normally finish before the request returns; if not, wait
+            # so the destination is complete and the source is not removed while being read
+            if copy["copy_status"] == "pending":
+                self._wait_for_copy(target, dst)
 
             if remove_src:
-                self._remove(src)
+                # only files are moved, and the source was just copied
+                self._remove(src, properties=AzureBlobInfo(exists=True, is_dir=False))
 
         return dst
 
-    def _remove(self, cloud_path: AzureBlobPath, missing_ok: bool = True) -> None:  # type: ignore
-        container_client = self.service_client.get_container_client(cloud_path.container)
-        file_or_dir = self._is_file_or_dir(cloud_path)
+    def _wait_for_copy(self, blob_client: "BlobClient", cloud_path: AzureBlobPath) -> None:
+        deadline = None
+        if self.copy_timeout is not None:
+            deadline = time.monotonic() + self.copy_timeout
+
+        interval = COPY_POLL_INTERVAL
+        copy_status = "pending"
+        while copy_status == "pending":
+            delay = interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise CloudPathException(
+                        f"Copy to {cloud_path} did not finish within {self.copy_timeout} seconds"
+                    )
+                delay = min(delay, remaining)
+
+            time.sleep(delay)
+            interval = min(interval * 2, MAX_COPY_POLL_INTERVAL)
+            copy_status = blob_client.get_blob_properties().copy.status
+
+        if copy_status != "success":
+            raise CloudPathException(
+                f"Copy operation failed for {cloud_path} with status: {copy_status}"
+            )
+
+    @staticmethod
+    def _delete_blobs(
+        executor: ThreadPoolExecutor,
+        container_client: "ContainerClient",
+        blob_names: Iterable[str],
+        pending: Deque[Future],
+    ) -> None:
+        def _submit(batch: List[str]) -> None:
+            # wait on the oldest batches once enough are queued, so a fast listing cannot
+            # run ahead of the deletes and hold every blob name in memory
+            while len(pending) >= 2 * MAX_BATCH_CONCURRENCY:
+                pending.popleft().result()
+
+            pending.append(executor.submit(container_client.delete_blobs, *batch))
+
+        batch: List[str] = []
+        for blob_name in blob_names:
+            batch.append(blob_name)
+
+            if len(batch) == MAX_BATCH_SIZE:
+                _submit(batch)
+                batch = []
+
+        if batch:
+            _submit(batch)
+
+    def _remove(  # type: ignore
+        self,
+        cloud_path: AzureBlobPath,
+        missing_ok: bool = True,
+        properties: Optional[AzureBlobInfo] = None,
+    ) -> None:
+        from azure.core.exceptions import ResourceNotFoundError
+
+        container_client = self._container_client(cloud_path.container)
+        file_or_dir = self._is_file_or_dir(cloud_path, properties)
 
         if not file_or_dir:
             if missing_ok:
@@ -240,27 +681,70 @@ class AzureBlobClient(Client):
 
             raise FileNotFoundError(f"File does not exist: {cloud_path}")
 
-        if file_or_dir == "dir":
-            blobs = [(blob.blob, is_dir) for blob, is_dir in self._list_dir(cloud_path, recursive=True)]
+        self._invalidate_metadata(cloud_path)
 
-            # need to delete files first to allow deleting the folders
-            files = [blob for blob, is_dir in blobs if not is_dir]
-            container_client.delete_blobs(*files)
-
-            # folders need to be deleted from the deepest to the shallowest
-            folders = sorted((blob for blob, is_dir in blobs if is_dir), reverse=True)
-            for folder in folders:
-                container_client.delete_blob(folder)
+        if file_or_dir == "dir":
+            prefix = cloud_path.blob
+            if prefix and not prefix.endswith("/"):
+                prefix += "/"
 
-        # delete the cloud_path itself
-        container_client.delete_blob(cloud_path.blob)
+            # delete files a page at a time as the listing arrives rather than after listing
+            # everything; folders are held back until the files they contain are gone
+            folders: List[str] = []
+            pages = container_client.list_blobs(
+                name_starts_with=prefix, results_per_page=5000
+            ).by_page()
+
+            # the SDK clients are thread-safe, so batches are sent from a pool of threads to
+            # overlap with each other and with fetching the next page of the listing
+            with self._checking_container(cloud_path.container), ThreadPoolExecutor(
+                max_workers=MAX_BATCH_CONCURRENCY
+            ) as executor:
+                pending: Deque[Future] = deque()
+
+                for page in pages:
+                    files = []
+                    for blob in page:
+                        if _is_folder_placeholder(blob):
+                            folders.append(blob.name)
+                        else:
+                            files.append(blob.name)
+
+                    self._delete_blobs(executor, container_client, files, pending)
+
+                while pending:
+                    pending.popleft().result()
+
+                # folders need to be deleted from the deepest to the shallowest; folders at the
+                # same depth cannot contain each other, so each level can go in the same batches
+                folders.sort(key=lambda folder: folder.count("/"), reverse=True)
+                for _, level in groupby(folders, key=lambda folder: folder.count("/")):
+                    self._delete_blobs(executor, container_client, level, pending)
+
+                    while pending:
+                        pending.popleft().result()
+
+            # on accounts without a hierarchical namespace the directory is only a prefix,
+            # so there may be no blob left to delete
+            try:
+                container_client.delete_blob(cloud_path.blob)
+            except ResourceNotFoundError as e:
+                self._forget_missing_container(cloud_path.container, e)
+        else:
+            try:
+                container_client.delete_blob(cloud_path.blob)
+            except ResourceNotFoundError as e:
+                # the blob was removed since it was last looked up
+                self._forget_missing_container(cloud_path.container, e)
+                if not missing_ok:
+                    raise FileNotFoundError(f"File does not exist: {cloud_path}")
 
     def _upload_file(
         self, local_path: Union[str, os.PathLike], cloud_path: AzureBlobPath
     ) -> AzureBlobPath:
-        blob = self.service_client.get_blob_client(
-            container=cloud_path.container, blob=cloud_path.blob
-        )
+        from azure.storage.blob import ContentSettings
+
+        blob = self._blob_client(cloud_path.container, cloud_path.blob)
 
         extra_args = {}
         if self.content_type_method is not None:
@@ -273,20 +757,27 @@ class AzureBlobClient(Client):
 
         content_settings = ContentSettings(**extra_args)
 
-        with Path(local_path).open("rb") as data:
-            blob.upload_blob(data, overwrite=True, content_settings=content_settings)  # type: ignore
+        with self._checking_container(cloud_path.container), Path(local_path).open("rb") as data:
+            blob.upload_blob(
+                data,  # type: ignore
+                overwrite=True,
+                content_settings=content_settings,
+                max_concurrency=self.max_upload_concurrency,
+            )
+
+        self._invalidate_metadata(cloud_path)
 
         return cloud_path
 
     def _get_public_url(self, cloud_path: AzureBlobPath) -> str:
-        blob_client = self.service_client.get_blob_client(
-            container=cloud_path.container, blob=cloud_path.blob
-        )
+        blob_client = self._blob_client(cloud_path.container, cloud_path.blob)
         return blob_client.url
 
     def _generate_presigned_url(
         self, cloud_path: AzureBlobPath, expire_seconds: int = 60 * 60
     ) -> str:
+        from azure.storage.blob import BlobSasPermissions, generate_blob_sas
+
         sas_token = generate_blob_sas(
             self.service_client.account_name,
             container_name=cloud_path.container,
@@ -1,18 +1,28 @@
+from contextlib import contextmanager
 import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import TYPE_CHECKING
-
-try:
-    from azure.core.exceptions import ResourceNotFoundError
-except ImportError:
-    pass
+import threading
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterator, Optional, Union
 
 from ..cloudpath import CloudPath, NoStatError, register_path_class
+from ..exceptions import CloudPathIsADirectoryError, CloudPathNotADirectoryError
 
 
 if TYPE_CHECKING:
-    from .azblobclient import AzureBlobClient
+    from .azblobclient import AzureBlobClient, AzureBlobInfo
+
+
+class _PrefetchedProperties(threading.local):
+    """Metadata fetched once by `open` and shared by the checks it makes, keyed by the id of
+    the path it was fetched for. Kept per thread so that other threads using the same path
+    object make their own lookups instead of seeing another call's snapshot."""
+
+    def __init__(self) -> None:
+        self.by_path: Dict[int, "AzureBlobInfo"] = {}
+
+
+_prefetched = _PrefetchedProperties()
 
 
 @register_path_class("azure")
@@ -33,15 +43,54 @@ class AzureBlobPath(CloudPath):
     cloud_prefix: str = "az://"
     client: "AzureBlobClient"
 
+    @property
+    def _prefetched_properties(self) -> Optional["AzureBlobInfo"]:
+        return _prefetched.by_path.get(id(self))
+
+    @contextmanager
+    def _reuse_properties(self) -> Iterator["AzureBlobInfo"]:
+        properties = self._prefetched_properties
+        if properties is not None:
+            yield properties
+            return
+
+        properties = self.client._get_blob_properties(self)
+        _prefetched.by_path[id(self)] = properties
+        try:
+            yield properties
+        finally:
+            del _prefetched.by_path[id(self)]
+
     @property
     def drive(self) -> str:
         return self.container
 
+    def exists(self) -> bool:
+        return self.client._exists(self, self._prefetched_properties)
+
     def is_dir(self) -> bool:
-        return self.client._is_file_or_dir(self) == "dir"
+        return self.client._is_file_or_dir(self, self._prefetched_properties) == "dir"
 
     def is_file(self) -> bool:
-        return self.client._is_file_or_dir(self) == "file"
+        return self.client._is_file_or_dir(self, self._prefetched_properties) == "file"
+
+    def unlink(self, missing_ok: bool = True) -> None:
+        # the lookup made here also tells the client what to delete
+        properties = self.client._get_blob_properties(self)
+        if properties.is_dir:
+            raise CloudPathIsADirectoryError(
+                f"Path {self} is a directory; call rmdir instead of unlink."
+            )
+        self.client._remove(self, missing_ok, properties=properties)
+
+    def rmtree(self) -> None:
+        """Delete an entire directory tree."""
+        properties = self.client._get_blob_properties(self)
+        if properties.exists and not properties.is_dir:
+            raise CloudPathNotADirectoryError(
+                f"Path {self} is a file; call unlink instead of rmtree."
+            )
+        self.client._remove(self, properties=properties)
 
     def mkdir(self, parents=False, exist_ok=False):
         # not possible to make empty directory on blob storage
@@ -61,10 +110,57 @@ class AzureBlobPath(CloudPath):
 
             tf.cleanup()
 
-    def stat(self):
+    def open(
+        self,
+        mode: str = "r",
+        buffering: int = -1,
+        encoding: Optional[str] = None,
+        errors: Optional[str] = None,
+        newline: Optional[str] = None,
+        force_overwrite_from_cloud: bool = False,  # extra kwarg not in pathlib
+        force_overwrite_to_cloud: bool = False,  # extra kwarg not in pathlib
+    ) -> IO[Any]:
+        with self._reuse_properties():
+            return super().open(
+                mode=mode,
+                buffering=buffering,
+                encoding=encoding,
+                errors=errors,
+                newline=newline,
+                force_overwrite_from_cloud=force_overwrite_from_cloud,
+                force_overwrite_to_cloud=force_overwrite_to_cloud,
+            )
+
+    def download_to(self, destination: Union[str, os.PathLike]) -> Path:
+        with self._reuse_properties() as properties:
+            if not properties.exists or properties.is_dir:
+                return super().download_to(destination)
+
+            destination = Path(destination)
+            if destination.is_dir():
+                destination = destination / self.name
+            return self.client._download_file(self, destination, properties=properties)
+
+    def download_if_exists(self, destination: Union[str, os.PathLike]) -> Optional[Path]:
+        """Download this file to `destination`, or return `None` if there is no blob at this
+        path. Unlike `download_to`, this skips the existence and type checks, so downloading a
+        file takes one request instead of several. Only files can be downloaded this way.
+        """
+        destination = Path(destination)
+        if destination.is_dir():
+            destination = destination / self.name
+
         try:
-            meta = self.client._get_metadata(self)
-        except ResourceNotFoundError:
+            return self.client._download_file(self, destination)
+        except FileNotFoundError:
+            return None
+
+    def stat(self):
+        properties = self._prefetched_properties
+        if properties is None:
+            properties = self.client._get_blob_properties(self, check_dir=False)
+
+        if properties.mtime is None:
             raise NoStatError(
                 f"No stats available for {self}; it may be a directory or not exist."
             )
@@ -77,9 +173,9 @@ class AzureBlobPath(CloudPath):
                 None,  # nlink,
                 None,  # uid,
                 None,  # gid,
-                meta.get("size", 0),  # size,
+                properties.size or 0,  # size,
                 None,  # atime,
-                meta.get("last_modified", 0).timestamp(),  # mtime,
+                properties.mtime.timestamp(),  # mtime,
                 None,  # ctime,
             )
         )
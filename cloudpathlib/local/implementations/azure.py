@@ -1,4 +1,6 @@
 import os
+from pathlib import Path
+from typing import Optional, Union
 
 from ...cloudpath import CloudImplementation
 from ...exceptions import MissingCredentialsError
@@ -53,6 +55,12 @@ class LocalAzureBlobPath(LocalPath):
         # not possible to make empty directory on blob storage
         pass
 
+    def download_if_exists(self, destination: Union[str, os.PathLike]) -> Optional[Path]:
+        if not self.is_file():
+            return None
+
+        return self.download_to(destination)
+
     @property
     def container(self) -> str:
         return self._no_prefix.split("/", 1)[0]
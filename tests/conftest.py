@@ -3,6 +3,7 @@ from pathlib import Path, PurePosixPath
 import shutil
 from typing import Dict, Optional
 
+import azure.storage.blob
 from azure.storage.blob import BlobServiceClient
 import boto3
 import botocore
@@ -24,7 +25,6 @@ from cloudpathlib.local import (
     LocalS3Client,
     LocalS3Path,
 )
-import cloudpathlib.azure.azblobclient
 import cloudpathlib.s3.s3client
 from .mock_clients.mock_azureblob import mocked_client_class_factory, DEFAULT_CONTAINER_NAME
 from .mock_clients.mock_gs import (
@@ -131,9 +131,9 @@ def azure_rig(request, monkeypatch, assets_dir):
             blob_client.upload_blob(test_file.read_bytes(), overwrite=True)
     else:
         monkeypatch.setenv("AZURE_STORAGE_CONNECTION_STRING", "")
-        # Mock cloud SDK
+        # Mock cloud SDK; AzureBlobClient imports it from the SDK when it is created
         monkeypatch.setattr(
-            cloudpathlib.azure.azblobclient,
+            azure.storage.blob,
             "BlobServiceClient",
             mocked_client_class_factory(test_dir),
         )
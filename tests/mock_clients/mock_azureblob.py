@@ -1,13 +1,17 @@
 from collections import namedtuple
 from datetime import datetime
+from hashlib import md5
+from itertools import islice
 from pathlib import Path, PurePosixPath
 import shutil
 from tempfile import TemporaryDirectory
+from threading import Lock
 
 
-from azure.storage.blob import BlobProperties
+from azure.storage.blob import BlobPrefix, BlobProperties
 from azure.storage.blob._shared.authentication import SharedKeyCredentialPolicy
-from azure.core.exceptions import ResourceNotFoundError
+from azure.core import MatchConditions
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
 
 from .utils import delete_empty_parents_up_to_root
 
@@ -75,14 +79,28 @@ class MockBlobClient:
     def url(self):
         return self.root / self.key
 
-    def get_blob_properties(self):
+    def get_blob_properties(self, etag=None, match_condition=None):
         path = self.root / self.key
         if path.exists() and path.is_file():
+            content_md5 = md5(path.read_bytes()).digest()
+
+            # the service gives a blob a new etag every time it is written or touched
+            current_etag = f'"{content_md5.hex()}-{path.stat().st_mtime_ns}"'
+            if match_condition == MatchConditions.IfModified and etag == current_etag:
+                # the SDK raises a plain HttpResponseError for a 304 from this request
+                error = HttpResponseError(
+                    message="Operation returned an invalid status 'Not Modified'"
+                )
+                error.status_code = 304
+                raise error
+
             return BlobProperties(
                 **{
                     "name": self.key,
                     "Last-Modified": datetime.fromtimestamp(path.stat().st_mtime),
-                    "ETag": "etag",
+                    "ETag": current_etag,
+                    "Content-Length": path.stat().st_size,
+                    "Content-MD5": bytearray(content_md5),
                     "content_type": self.service_client.metadata_cache.get(
                         self.root / self.key, None
                     ),
@@ -91,8 +109,8 @@ class MockBlobClient:
         else:
             raise ResourceNotFoundError
 
-    def download_blob(self):
-        return MockStorageStreamDownloader(self.root, self.key)
+    def download_blob(self, max_concurrency=1):
+        return MockStorageStreamDownloader(self.root, self.key, self.get_blob_properties())
 
     def set_blob_metadata(self, metadata):
         path = self.root / self.key
@@ -103,12 +121,14 @@ class MockBlobClient:
         dst.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy(src=str(source_url), dst=str(dst))
 
+        return {"copy_id": "copy_id", "copy_status": "success"}
+
     def delete_blob(self):
         path = self.root / self.key
         path.unlink()
         delete_empty_parents_up_to_root(path=path, root=self.root)
 
-    def upload_blob(self, data, overwrite, content_settings=None):
+    def upload_blob(self, data, overwrite, content_settings=None, max_concurrency=1):
         path = self.root / self.key
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_bytes(data.read())
@@ -120,9 +140,11 @@ class MockBlobClient:
 
 
 class MockStorageStreamDownloader:
-    def __init__(self, root, key):
+    def __init__(self, root, key, properties):
         self.root = root
         self.key = key
+        self.properties = properties
+        self.size = properties.size
 
     def readall(self):
         return (self.root / self.key).read_bytes()
@@ -135,6 +157,9 @@ class MockStorageStreamDownloader:
 
 
 class MockContainerClient:
+    # deletes prune empty parent directories, which is not safe to run from several threads
+    delete_lock = Lock()
+
     def __init__(self, root, container_name):
         self.root = root
         self.container_name = container_name
@@ -145,13 +170,51 @@ class MockContainerClient:
         else:
             return False
 
-    def list_blobs(self, name_starts_with=None):
-        return mock_item_paged(self.root, name_starts_with)
+    def list_blobs(self, name_starts_with=None, results_per_page=None):
+        return MockItemPaged(mock_item_paged(self.root, name_starts_with), results_per_page)
+
+    def walk_blobs(self, name_starts_with=None):
+        return mock_walk_paged(self.root, name_starts_with)
+
+    def delete_blob(self, blob):
+        path = self.root / blob
+        if not path.is_file():
+            raise ResourceNotFoundError
+
+        path.unlink()
+        delete_empty_parents_up_to_root(path=path, root=self.root)
 
     def delete_blobs(self, *blobs):
-        for blob in blobs:
-            (self.root / blob).unlink()
-            delete_empty_parents_up_to_root(path=self.root / blob, root=self.root)
+        # the service rejects batches with more than 256 subrequests
+        if len(blobs) > 256:
+            raise ValueError("The batch request may contain at most 256 subrequests.")
+
+        with self.delete_lock:
+            for blob in blobs:
+                (self.root / blob).unlink()
+                delete_empty_parents_up_to_root(path=self.root / blob, root=self.root)
+
+
+class MockItemPaged:
+    """Iterator over listing results that can also be consumed page by page, like
+    azure.core.paging.ItemPaged"""
+
+    def __init__(self, items, results_per_page=None):
+        self.items = iter(items)
+        self.results_per_page = results_per_page or 5000
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self.items)
+
+    def by_page(self):
+        while True:
+            page = list(islice(self.items, self.results_per_page))
+            if not page:
+                return
+            yield iter(page)
 
 
 def mock_item_paged(root, name_starts_with=None):
@@ -175,5 +238,35 @@ def mock_item_paged(root, name_starts_with=None):
                 "name": str(mocked.relative_to(PurePosixPath(root))),
                 "Last-Modified": datetime.fromtimestamp(local.stat().st_mtime),
                 "ETag": "etag",
+                "Content-Length": local.stat().st_size,
+                "Content-MD5": bytearray(md5(local.read_bytes()).digest()),
             }
         )
+
+
+def mock_walk_paged(root, name_starts_with=None):
+    if not name_starts_with:
+        name_starts_with = ""
+
+    folder = root / name_starts_with
+    if not folder.is_dir():
+        return
+
+    for f in sorted(folder.iterdir()):
+        if f.name.startswith("."):
+            continue
+
+        name = str(PurePosixPath(f.relative_to(root)))
+        if f.is_dir():
+            # BlobPrefix names for virtual directories have a trailing slash
+            yield BlobPrefix(name=f"{name}/", prefix=f"{name}/")
+        else:
+            yield BlobProperties(
+                **{
+                    "name": name,
+                    "Last-Modified": datetime.fromtimestamp(f.stat().st_mtime),
+                    "ETag": "etag",
+                    "Content-Length": f.stat().st_size,
+                    "Content-MD5": bytearray(md5(f.read_bytes()).digest()),
+                }
+            )
@@ -1,14 +1,30 @@
 import os
+import subprocess
+import sys
+import threading
 
-from azure.storage.blob import StorageStreamDownloader
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
+from azure.core.pipeline.transport import HttpTransport, RequestsTransportResponse
+from azure.storage.blob import BlobServiceClient, StorageStreamDownloader
 import pytest
+import requests
 
 from urllib.parse import urlparse, parse_qs
 from cloudpathlib import AzureBlobClient, AzureBlobPath
-from cloudpathlib.exceptions import MissingCredentialsError
+import cloudpathlib.azure.azblobclient
+from cloudpathlib.azure.azblobclient import AzureBlobInfo
+from cloudpathlib.exceptions import (
+    CloudPathException,
+    CloudPathIsADirectoryError,
+    MissingCredentialsError,
+)
 from cloudpathlib.local import LocalAzureBlobClient, LocalAzureBlobPath
 
-from .mock_clients.mock_azureblob import MockStorageStreamDownloader
+from .mock_clients.mock_azureblob import (
+    MockBlobClient,
+    MockContainerClient,
+    MockStorageStreamDownloader,
+)
 
 
 @pytest.mark.parametrize("path_class", [AzureBlobPath, LocalAzureBlobPath])
@@ -79,3 +95,470 @@ def test_partial_download(azure_rig, monkeypatch):
 
         assert not p._local.exists()
         assert not p.client._partial_filename(p._local).exists()
+
+
+def test_download_preallocates(azure_rig, monkeypatch, tmp_path):
+    p: AzureBlobPath = azure_rig.create_cloud_path("dir_0/file0_0.txt")
+    p.write_text("hello")
+
+    sizes = []
+
+    def _fallocate(fd, offset, length):
+        sizes.append(length)
+        raise OSError("not supported")
+
+    monkeypatch.setattr(os, "posix_fallocate", _fallocate, raising=False)
+
+    # small files are not worth preallocating
+    assert p.download_to(tmp_path / "small.txt").read_text() == "hello"
+    assert sizes == []
+
+    # a filesystem that cannot preallocate is not an error
+    monkeypatch.setattr(cloudpathlib.azure.azblobclient, "MIN_PREALLOCATE_SIZE", 1)
+    assert p.download_to(tmp_path / "large.txt").read_text() == "hello"
+    assert sizes == [len("hello")]
+
+
+def test_metadata_fetched_once(azure_rig, monkeypatch, tmp_path):
+    # without the metadata cache, so each operation has to make its own lookup
+    client = azure_rig.client_class(metadata_cache_ttl=0)
+    p: AzureBlobPath = azure_rig.create_cloud_path("dir_0/file0_0.txt", client=client)
+
+    calls = []
+    original_get_metadata = p.client._get_metadata
+
+    def _counting_get_metadata(cloud_path, etag=None):
+        calls.append((cloud_path, etag))
+        return original_get_metadata(cloud_path, etag=etag)
+
+    monkeypatch.setattr(p.client, "_get_metadata", _counting_get_metadata)
+
+    # exists, is_file, and stat checks made by open share a single lookup
+    p.read_text()
+    assert len(calls) == 1
+
+    calls.clear()
+    p.download_to(tmp_path)
+    assert len(calls) == 1
+    assert (tmp_path / p.name).read_text() == p.read_text()
+
+
+def test_remove_reuses_metadata(azure_rig, monkeypatch):
+    client = azure_rig.client_class(metadata_cache_ttl=0)
+
+    calls = []
+    original_get_blob_properties = client._get_blob_properties
+
+    def _counting_get_blob_properties(cloud_path, *args, **kwargs):
+        calls.append(cloud_path)
+        return original_get_blob_properties(cloud_path, *args, **kwargs)
+
+    monkeypatch.setattr(client, "_get_blob_properties", _counting_get_blob_properties)
+
+    # the check made before deleting also decides how to delete
+    azure_rig.create_cloud_path("dir_0/file0_0.txt", client=client).unlink()
+    assert len(calls) == 1
+
+    calls.clear()
+    azure_rig.create_cloud_path("dir_1", client=client).rmtree()
+    assert len(calls) == 1
+
+    with pytest.raises(CloudPathIsADirectoryError):
+        azure_rig.create_cloud_path("dir_0", client=client).unlink()
+
+
+def test_prefetched_metadata_is_per_thread(azure_rig):
+    p: AzureBlobPath = azure_rig.create_cloud_path("dir_0/file0_0.txt")
+
+    seen_by_other_thread = []
+
+    with p._reuse_properties() as properties:
+        assert p._prefetched_properties is properties
+
+        # other threads using the same path object look the path up themselves
+        thread = threading.Thread(
+            target=lambda: seen_by_other_thread.append(p._prefetched_properties)
+        )
+        thread.start()
+        thread.join()
+
+    assert seen_by_other_thread == [None]
+    assert p._prefetched_properties is None
+
+
+def test_metadata_cache(azure_rig, monkeypatch):
+    client = azure_rig.client_class(metadata_cache_ttl=5)
+    p: AzureBlobPath = azure_rig.create_cloud_path("new_dir/new_file.txt", client=client)
+
+    now = [1000.0]
+    monkeypatch.setattr(cloudpathlib.azure.azblobclient.time, "monotonic", lambda: now[0])
+
+    calls = []
+    original_get_metadata = client._get_metadata
+
+    def _counting_get_metadata(cloud_path, etag=None):
+        calls.append((cloud_path, etag))
+        return original_get_metadata(cloud_path, etag=etag)
+
+    monkeypatch.setattr(client, "_get_metadata", _counting_get_metadata)
+
+    assert not p.exists()
+    assert not p.is_file()
+    assert not p.parent.is_dir()
+    assert len(calls) == 2
+
+    # writes through the client replace what was cached for the path and its parents
+    p.write_text("hello")
+    assert p.is_file()
+    assert p.parent.is_dir()
+
+    # an expired entry for an unchanged blob is revalidated with its etag
+    properties = client._get_blob_properties(p)
+    now[0] += 5
+    calls.clear()
+    assert client._get_blob_properties(p) is properties
+    assert calls == [(p, properties.etag)]
+
+    # changes made elsewhere are seen once the entry expires
+    client.service_client.get_blob_client(container=p.container, blob=p.blob).delete_blob()
+    assert p.exists()
+
+    now[0] += 5
+    assert not p.exists()
+
+    p.write_text("hello")
+    p.parent.rmtree()
+    assert not p.exists()
+    assert not p.parent.exists()
+
+
+def test_rmtree_container_root_clears_metadata_cache(azure_rig):
+    if azure_rig.live_server:
+        pytest.skip("removes everything in the test container")
+
+    client = azure_rig.client_class(metadata_cache_ttl=60)
+    p: AzureBlobPath = azure_rig.create_cloud_path("dir_0/file0_0.txt", client=client)
+    assert p.is_file()
+    assert p.parent.is_dir()
+
+    client.CloudPath(f"az://{p.container}/").rmtree()
+    assert not p.exists()
+    assert not p.parent.exists()
+
+
+def test_metadata_revalidated_against_sdk(monkeypatch):
+    # run the real SDK against a transport that answers every request with a fixed status
+    class _FixedStatusTransport(HttpTransport):
+        status = 304
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+        def open(self):
+            pass
+
+        def close(self):
+            pass
+
+        def send(self, request, **kwargs):
+            response = requests.Response()
+            response.status_code = self.status
+            response._content = b""
+            return RequestsTransportResponse(request, response)
+
+    transport = _FixedStatusTransport()
+    service_client = BlobServiceClient.from_connection_string(
+        "DefaultEndpointsProtocol=https;AccountName=fake;AccountKey=ZmFrZQ==;"
+        "EndpointSuffix=core.windows.net",
+        transport=transport,
+        retry_total=0,
+    )
+    client = AzureBlobClient(blob_service_client=service_client)
+    p = client.CloudPath("az://container/file.txt")
+
+    now = [1000.0]
+    monkeypatch.setattr(cloudpathlib.azure.azblobclient.time, "monotonic", lambda: now[0])
+
+    stale = AzureBlobInfo(exists=True, is_dir=False, size=5, etag='"etag"')
+    client._metadata_cache[(p.container, p.blob)] = (now[0], stale)
+
+    # an unchanged blob keeps its cached properties
+    assert client._get_blob_properties(p) is stale
+
+    # any other error is not mistaken for the blob being unchanged
+    now[0] += client.metadata_cache_ttl
+    transport.status = 500
+    with pytest.raises(HttpResponseError):
+        client._get_blob_properties(p)
+
+
+def test_container_existence_remembered(azure_rig, monkeypatch, tmp_path):
+    if azure_rig.live_server:
+        pytest.skip("inspects the requests made to the mocked SDK")
+
+    client = azure_rig.client_class()
+    container = client.CloudPath(f"az://{azure_rig.drive}")
+
+    checks = []
+    original_exists = MockContainerClient.exists
+
+    def _counting_exists(self):
+        checks.append(self.container_name)
+        return original_exists(self)
+
+    monkeypatch.setattr(MockContainerClient, "exists", _counting_exists)
+
+    assert container.exists()
+    assert container.exists()
+    assert len(checks) == 1
+
+    # a container that turns out to be gone is checked again
+    def _container_not_found(self, *args, **kwargs):
+        error = ResourceNotFoundError()
+        error.error_code = "ContainerNotFound"
+        raise error
+
+    monkeypatch.setattr(MockBlobClient, "download_blob", _container_not_found)
+
+    with pytest.raises(FileNotFoundError):
+        client._download_file(container / "file.txt", tmp_path / "file.txt")
+
+    assert container.exists()
+    assert len(checks) == 2
+
+    monkeypatch.setattr(MockBlobClient, "upload_blob", _container_not_found)
+    (tmp_path / "upload.txt").write_text("hello")
+
+    with pytest.raises(ResourceNotFoundError):
+        client._upload_file(tmp_path / "upload.txt", container / "file.txt")
+
+    assert container.exists()
+    assert len(checks) == 3
+
+    # without the metadata cache every check goes to the service
+    uncached_client = azure_rig.client_class(metadata_cache_ttl=0)
+    uncached_container = uncached_client.CloudPath(f"az://{azure_rig.drive}")
+
+    checks.clear()
+    assert uncached_container.exists()
+    assert uncached_container.exists()
+    assert len(checks) == 2
+
+
+def test_transfer_concurrency(azure_rig):
+    default_client = azure_rig.client_class()
+    assert 1 <= default_client.max_download_concurrency <= 64
+    assert 1 <= default_client.max_upload_concurrency <= 64
+
+    client = azure_rig.client_class(max_download_concurrency=3, max_upload_concurrency=2)
+    assert client.max_download_concurrency == 3
+    assert client.max_upload_concurrency == 2
+
+    p: AzureBlobPath = azure_rig.create_cloud_path("dir_0/file0_0.txt", client=client)
+    p.write_text("hello")
+    assert p.read_text() == "hello"
+
+
+def test_rmtree_batches_deletes(azure_rig):
+    p: AzureBlobPath = azure_rig.create_cloud_path("many_files")
+
+    for i in range(300):
+        (p / f"file_{i}.txt").write_text("content")
+
+    p.rmtree()
+    assert not p.exists()
+
+
+def test_rmtree_pages(azure_rig, monkeypatch):
+    p: AzureBlobPath = azure_rig.create_cloud_path("dir_1")
+
+    if not azure_rig.live_server:
+        # force several listing pages so deletes are interleaved with listing
+        original_list_blobs = MockContainerClient.list_blobs
+
+        def _small_pages(self, name_starts_with=None, results_per_page=None):
+            return original_list_blobs(self, name_starts_with, results_per_page=1)
+
+        monkeypatch.setattr(MockContainerClient, "list_blobs", _small_pages)
+
+    p.rmtree()
+    assert not p.exists()
+    assert azure_rig.create_cloud_path("dir_0/file0_0.txt").exists()
+
+
+def test_sdk_clients_reused(azure_rig):
+    client = azure_rig.client_class()
+    p: AzureBlobPath = azure_rig.create_cloud_path("dir_0/file0_0.txt", client=client)
+
+    assert client._blob_client(p.container, p.blob) is client._blob_client(p.container, p.blob)
+    assert client._container_client(p.container) is client._container_client(p.container)
+
+
+def test_dir_probe_fetches_single_result(azure_rig, monkeypatch):
+    if azure_rig.live_server:
+        pytest.skip("inspects the requests made to the mocked SDK")
+
+    page_sizes = []
+    original_list_blobs = MockContainerClient.list_blobs
+
+    def _recording_list_blobs(self, name_starts_with=None, results_per_page=None):
+        page_sizes.append(results_per_page)
+        return original_list_blobs(self, name_starts_with, results_per_page)
+
+    monkeypatch.setattr(MockContainerClient, "list_blobs", _recording_list_blobs)
+
+    assert azure_rig.create_cloud_path("dir_0").is_dir()
+    assert not azure_rig.create_cloud_path("not_a_dir").exists()
+    assert page_sizes == [1, 1]
+
+
+@pytest.mark.parametrize("final_status", ["success", "failed"])
+def test_move_waits_for_pending_copy(azure_rig, monkeypatch, final_status):
+    if azure_rig.live_server:
+        pytest.skip("simulates a copy that the service runs asynchronously")
+
+    monkeypatch.setattr(cloudpathlib.azure.azblobclient, "COPY_POLL_INTERVAL", 0)
+
+    original_start_copy = MockBlobClient.start_copy_from_url
+    original_get_properties = MockBlobClient.get_blob_properties
+
+    def _pending_copy(self, source_url):
+        original_start_copy(self, source_url)
+        return {"copy_id": "copy_id", "copy_status": "pending"}
+
+    def _finished_copy_properties(self):
+        properties = original_get_properties(self)
+        properties.copy.status = final_status
+        return properties
+
+    monkeypatch.setattr(MockBlobClient, "start_copy_from_url", _pending_copy)
+    monkeypatch.setattr(MockBlobClient, "get_blob_properties", _finished_copy_properties)
+
+    src: AzureBlobPath = azure_rig.create_cloud_path("dir_0/file0_0.txt")
+    dst: AzureBlobPath = azure_rig.create_cloud_path("dir_0/file0_0_moved.txt")
+
+    if final_status == "success":
+        src.rename(dst)
+        assert not src.exists()
+    else:
+        with pytest.raises(CloudPathException):
+            src.rename(dst)
+        assert src.exists()
+
+
+def test_copy_wait_backs_off_and_times_out(azure_rig, monkeypatch):
+    if azure_rig.live_server:
+        pytest.skip("simulates a copy that the service runs asynchronously")
+
+    now = [1000.0]
+    sleeps = []
+
+    def _sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(cloudpathlib.azure.azblobclient.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(cloudpathlib.azure.azblobclient.time, "sleep", _sleep)
+
+    original_start_copy = MockBlobClient.start_copy_from_url
+    original_get_properties = MockBlobClient.get_blob_properties
+
+    def _pending_copy(self, source_url):
+        original_start_copy(self, source_url)
+        return {"copy_id": "copy_id", "copy_status": "pending"}
+
+    def _stuck_copy_properties(self, *args, **kwargs):
+        properties = original_get_properties(self, *args, **kwargs)
+        properties.copy.status = "pending"
+        return properties
+
+    monkeypatch.setattr(MockBlobClient, "start_copy_from_url", _pending_copy)
+    monkeypatch.setattr(MockBlobClient, "get_blob_properties", _stuck_copy_properties)
+
+    client = azure_rig.client_class(copy_timeout=10)
+    src: AzureBlobPath = azure_rig.create_cloud_path("dir_0/file0_0.txt", client=client)
+    dst: AzureBlobPath = azure_rig.create_cloud_path("dir_0/file0_0_moved.txt", client=client)
+
+    with pytest.raises(CloudPathException):
+        src.rename(dst)
+
+    # polls back off exponentially and stop at the deadline, leaving the source in place
+    assert sleeps == [0.5, 1, 2, 4, 2.5]
+    assert src.exists()
+
+
+def test_download_if_exists(azure_rig, tmp_path):
+    p: AzureBlobPath = azure_rig.create_cloud_path("dir_0/file0_0.txt")
+    p.write_text("content")
+
+    assert p.download_if_exists(tmp_path) == tmp_path / p.name
+    assert (tmp_path / p.name).read_text() == "content"
+
+    missing: AzureBlobPath = azure_rig.create_cloud_path("dir_0/not_a_file.txt")
+    assert missing.download_if_exists(tmp_path) is None
+    assert not (tmp_path / missing.name).exists()
+    assert not missing.client._partial_filename(tmp_path / missing.name).exists()
+
+
+def test_list_dir_uses_listing_results(azure_rig, monkeypatch):
+    p: AzureBlobPath = azure_rig.create_cloud_path("dir_1")
+
+    def _no_lookups(*args, **kwargs):
+        raise AssertionError("listing a directory should not look up each entry")
+
+    monkeypatch.setattr(p.client, "_get_metadata", _no_lookups)
+
+    assert {(c.name, is_dir) for c, is_dir in p.client._list_dir(p)} == {
+        ("file_1_0.txt", False),
+        ("dir_1_0", True),
+    }
+    assert {(c.name, is_dir) for c, is_dir in p.client._list_dir(p, recursive=True)} == {
+        ("file_1_0.txt", False),
+        ("file_1_0_0.txt", False),
+    }
+
+
+def test_rmtree_bounds_queued_batches(azure_rig, monkeypatch):
+    # tiny batches and a single worker so that deletes queue up behind the listing
+    monkeypatch.setattr(cloudpathlib.azure.azblobclient, "MAX_BATCH_SIZE", 2)
+    monkeypatch.setattr(cloudpathlib.azure.azblobclient, "MAX_BATCH_CONCURRENCY", 1)
+
+    p: AzureBlobPath = azure_rig.create_cloud_path("many_files")
+    for i in range(15):
+        (p / f"file_{i}.txt").write_text("content")
+
+    p.rmtree()
+    assert not p.exists()
+
+
+def test_upload_block_settings():
+    client = AzureBlobClient(
+        connection_string="AccountName=fake;AccountKey=ZmFrZQ==;",
+        max_block_size=2 * 1024 * 1024,
+    )
+
+    # files larger than one block are uploaded in parallel blocks
+    config = client.service_client._config
+    assert config.max_block_size == 2 * 1024 * 1024
+    assert config.max_single_put_size == 2 * 1024 * 1024
+
+
+def test_pooled_session():
+    session = cloudpathlib.azure.azblobclient._pooled_session()
+
+    adapter = session.get_adapter("https://account.blob.core.windows.net")
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 128
+    assert not adapter.max_retries.total
+
+    # request bodies are written in the same block size as azure-core's default adapter
+    request = requests.Request("PUT", "https://account.blob.core.windows.net/c/b").prepare()
+    conn = adapter.get_connection_with_tls_context(request, verify=True)
+    assert conn.conn_kw["blocksize"] == 32 * 1024
+
+
+def test_sdk_imported_lazily():
+    code = "import sys, cloudpathlib; assert 'azure.storage.blob' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)